@@ -1,26 +1,95 @@
 #!/usr/bin/env python3
+import datetime
+import email.utils
 import http.server
-import socketserver
+import os
+import socket
+from http import HTTPStatus
 
 PORT = 3006
 DIRECTORY = "."
 
+# In-memory file cache keyed by path: (mtime, bytes). The test page is
+# static, so re-read from disk only when the file actually changes.
+_CACHE = {}
+
 class Handler(http.server.SimpleHTTPRequestHandler):
+    # HTTP/1.1 enables keep-alive so browsers fetch the HTML, JS and
+    # favicon over one TCP connection instead of one each
+    protocol_version = 'HTTP/1.1'
+
+    # Fully buffer reads and write responses in 64 KiB chunks so a whole
+    # response goes out in one write() instead of many small syscalls
+    rbufsize = -1
+    wbufsize = 65536
+
+    # Small responses shouldn't wait for Nagle coalescing
+    disable_nagle_algorithm = True
+
     def do_GET(self):
         if self.path == '/' or self.path == '':
             self.path = '/connection_test.html'
-        return http.server.SimpleHTTPRequestHandler.do_GET(self)
+
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            # Directories and missing files keep the stock behaviour
+            return http.server.SimpleHTTPRequestHandler.do_GET(self)
+
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        # Conditional GET: answer 304 when the client's copy is current
+        ims = self.headers.get('If-Modified-Since')
+        if ims:
+            try:
+                ims_dt = email.utils.parsedate_to_datetime(ims)
+                if ims_dt.tzinfo is None:
+                    ims_dt = ims_dt.replace(tzinfo=datetime.timezone.utc)
+                if int(mtime) <= int(ims_dt.timestamp()):
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    self.send_header("Last-Modified", self.date_time_string(int(mtime)))
+                    self.end_headers()
+                    return
+            except (TypeError, ValueError, OverflowError):
+                pass  # Unparseable date; fall through and send the body
+
+        cached = _CACHE.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, 'rb') as f:
+                data = f.read()
+            _CACHE[path] = (mtime, data)
+        else:
+            data = cached[1]
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Last-Modified", self.date_time_string(int(mtime)))
+        self.end_headers()
+        self.wfile.write(data)
+
+class BufferedHTTPServer(http.server.ThreadingHTTPServer):
+    def server_bind(self):
+        # Larger kernel buffers let whole responses queue without blocking
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
+        super().server_bind()
 
 if __name__ == '__main__':
     Handler.extensions_map.update({
         '.html': 'text/html',
         '.js': 'application/javascript',
     })
-    
+
     print(f"Starting HTTP server on http://localhost:{PORT}")
     print(f"Access the connection test page at: http://localhost:{PORT}")
-    
-    with socketserver.TCPServer(("", PORT), Handler) as httpd:
+
+    # ThreadingHTTPServer handles each connection in its own thread so one
+    # slow client no longer blocks everyone else
+    with BufferedHTTPServer(("", PORT), Handler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
@@ -1,53 +1,59 @@
 #!/usr/bin/env python3
-import urllib.request
-import urllib.parse
-import urllib.error
 import json
-import ssl
+import socket
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+class NoNagleHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that disables Nagle's algorithm on new connections.
+
+    The login payloads are small JSON POSTs; without TCP_NODELAY the kernel
+    can delay them up to ~40 ms waiting to coalesce segments.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        ]
+        super().init_poolmanager(*args, **kwargs)
 
 # Base URL using direct IP to avoid IPv6 resolution issues (per your configuration)
 BASE_URL = "http://127.0.0.1:3001"
 
-def test_login(email, password):
+def test_login(session, email, password):
     """Test login with specified credentials"""
     url = f"{BASE_URL}/api/auth/login"
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
     payload = {
         'email': email,
         'password': password
     }
-    
+
     print(f"Testing login with: {email} / {password}")
     try:
-        # Create a context that ignores SSL certificate validation (for testing only)
-        context = ssl._create_unverified_context()
-        
-        # Prepare the request data
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(url, data=data, headers=headers, method='POST')
-        
-        # Send the request
-        with urllib.request.urlopen(req, context=context) as response:
-            status_code = response.getcode()
-            print(f"Status code: {status_code}")
-            
-            if status_code == 200:
-                response_data = json.loads(response.read().decode('utf-8'))
-                print("SUCCESS!")
-                print(f"Token: {response_data.get('access_token', 'No token found')[:10]}...")
-                print(f"User: {json.dumps(response_data.get('user', {}), indent=2)}")
-                return True
-            else:
-                print(f"Failed with status code: {status_code}")
-                return False
-    except urllib.error.HTTPError as e:
-        print(f"HTTP Error: {e.code} - {e.reason}")
+        # Reuse the shared keep-alive session so all attempts share one
+        # TCP connection instead of paying a handshake per request
+        response = session.post(url, json=payload, timeout=5)
+        status_code = response.status_code
+        print(f"Status code: {status_code}")
+
+        if status_code == 200:
+            response_data = response.json()
+            print("SUCCESS!")
+            print(f"Token: {response_data.get('access_token', 'No token found')[:10]}...")
+            print(f"User: {json.dumps(response_data.get('user', {}), indent=2)}")
+            return True
+        else:
+            print(f"Failed with status code: {status_code}")
+            return False
+    except requests.exceptions.ConnectionError as e:
+        print(f"Connection Error: {e}")
         return False
-    except urllib.error.URLError as e:
-        print(f"URL Error: {e.reason}")
+    except requests.exceptions.Timeout:
+        print("Request timed out")
         return False
     except Exception as e:
         print(f"Error: {str(e)}")
@@ -65,14 +71,30 @@ credentials = [
 print("=== Norma AI Login Test ===")
 print(f"Connecting to API at: {BASE_URL}\n")
 
+# One session for all attempts: the pool holds a keep-alive connection per
+# worker thread, so only the first request on each pays the TCP handshake
+session = requests.Session()
+session.mount('http://', NoNagleHTTPAdapter(pool_connections=1, pool_maxsize=10))
+session.headers.update({'Accept': 'application/json'})
+
+# The endpoint is stateless, so fire all attempts concurrently and take the
+# first success: total wall time is ~one round trip instead of one per guess
 success = False
-for email, password in credentials:
-    if test_login(email, password):
-        print(f"\n✅ FOUND WORKING CREDENTIALS: {email} / {password}")
-        print("Use these credentials to log in through the web interface")
-        success = True
-        break
-    print("\n---\n")
+try:
+    with ThreadPoolExecutor(max_workers=len(credentials)) as executor:
+        futures = {
+            executor.submit(test_login, session, email, password): (email, password)
+            for email, password in credentials
+        }
+        for future in as_completed(futures):
+            if future.result():
+                email, password = futures[future]
+                print(f"\n✅ FOUND WORKING CREDENTIALS: {email} / {password}")
+                print("Use these credentials to log in through the web interface")
+                success = True
+                break
+finally:
+    session.close()
 
 if not success:
     print("\n❌ None of the test credentials worked.")
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
-from app import app, db
+from app import create_app
+from models import db
 from models.user import User
 from models.document import Document
 
+app = create_app()
+
 with app.app_context():
     print('Database check:')
     print('===============')
@@ -2,9 +2,12 @@
 """
 Script to create an administrator user in the Norma AI database.
 """
-from app import app, db
+from app import create_app
+from models import db
 from models.user import User
 
+app = create_app()
+
 # Admin credentials - easy to remember for testing
 ADMIN_EMAIL = "admin@example.com"
 ADMIN_PASSWORD = "Admin123!"
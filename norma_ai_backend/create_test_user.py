@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
-from app import app, db
+from app import create_app
+from models import db
 from models.user import User
 import datetime
 
+app = create_app()
+
 # Test user credentials
 TEST_EMAIL = "test@example.com"
 TEST_PASSWORD = "password123"
@@ -4,13 +4,17 @@ Gunicorn configuration file for Render deployment
 import os
 
 # Worker configuration
-workers = int(os.environ.get('GUNICORN_WORKERS', 3))
+workers = int(os.environ.get('GUNICORN_WORKERS', 2 * (os.cpu_count() or 1) + 1))
 threads = int(os.environ.get('GUNICORN_THREADS', 2))
 worker_class = 'gevent'
 worker_connections = 1000
 timeout = 60
 keepalive = 5
 
+# Build the app in the master before forking: workers share the imported
+# blueprints via copy-on-write instead of re-running create_app() each
+preload_app = True
+
 # Access logging
 accesslog = '-'
 errorlog = '-'
@@ -2,9 +2,12 @@
 """
 Script to list all users in the Norma AI database.
 """
-from app import app, db
+from app import create_app
+from models import db
 from models.user import User
 
+app = create_app()
+
 def list_users():
     with app.app_context():
         users = User.query.all()
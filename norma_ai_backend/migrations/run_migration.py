@@ -13,10 +13,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Import the Flask app and db
-from app import app
+# Import the Flask app factory and db
+from app import create_app
 from models import db
 
+app = create_app()
+
 def add_column_if_not_exists(table_name, column_name, column_type, default_value=None):
     """Add a column to a table if it doesn't already exist."""
     
@@ -1,5 +1,4 @@
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required
 from models import db
 from models.user import User
 from services.auth_middleware import admin_required
@@ -7,16 +6,10 @@ from services.auth_service import validate_registration_data
 
 admin_bp = Blueprint('admin', __name__)
 
-@admin_bp.route('/api/admin/users', methods=['GET', 'OPTIONS'])
-@jwt_required()
+@admin_bp.route('/users', methods=['GET'])
 @admin_required()
 def get_users():
     """Get all users (admin only)."""
-    
-    # Handle OPTIONS requests for CORS preflight
-    if request.method == 'OPTIONS':
-        return jsonify({"message": "OK"}), 200
-    
     # Get query parameters for pagination
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
@@ -41,16 +34,10 @@ def get_users():
         }
     }), 200
 
-@admin_bp.route('/api/admin/users', methods=['POST', 'OPTIONS'])
-@jwt_required()
+@admin_bp.route('/users', methods=['POST'])
 @admin_required()
 def create_user():
     """Create a new user (admin only)."""
-    
-    # Handle OPTIONS requests for CORS preflight
-    if request.method == 'OPTIONS':
-        return jsonify({"message": "OK"}), 200
-    
     data = request.get_json()
     
     # Validate user data
@@ -82,16 +69,10 @@ def create_user():
         "user": new_user.to_dict()
     }), 201
 
-@admin_bp.route('/api/admin/users/<int:user_id>', methods=['GET', 'OPTIONS'])
-@jwt_required()
+@admin_bp.route('/users/<int:user_id>', methods=['GET'])
 @admin_required()
 def get_user(user_id):
     """Get a specific user (admin only)."""
-    
-    # Handle OPTIONS requests for CORS preflight
-    if request.method == 'OPTIONS':
-        return jsonify({"message": "OK"}), 200
-    
     user = User.query.get(user_id)
     
     if not user:
@@ -103,16 +84,10 @@ def get_user(user_id):
         "user": user.to_dict()
     }), 200
 
-@admin_bp.route('/api/admin/users/<int:user_id>', methods=['PUT', 'OPTIONS'])
-@jwt_required()
+@admin_bp.route('/users/<int:user_id>', methods=['PUT'])
 @admin_required()
 def update_user(user_id):
     """Update a user (admin only)."""
-    
-    # Handle OPTIONS requests for CORS preflight
-    if request.method == 'OPTIONS':
-        return jsonify({"message": "OK"}), 200
-    
     user = User.query.get(user_id)
     
     if not user:
@@ -155,16 +130,10 @@ def update_user(user_id):
         "user": user.to_dict()
     }), 200
 
-@admin_bp.route('/api/admin/users/<int:user_id>', methods=['DELETE', 'OPTIONS'])
-@jwt_required()
+@admin_bp.route('/users/<int:user_id>', methods=['DELETE'])
 @admin_required()
 def delete_user(user_id):
     """Delete a user (admin only)."""
-    
-    # Handle OPTIONS requests for CORS preflight
-    if request.method == 'OPTIONS':
-        return jsonify({"message": "OK"}), 200
-    
     user = User.query.get(user_id)
     
     if not user:
@@ -1,7 +1,8 @@
+import json
 import os
 import traceback
 from datetime import datetime
-from flask import Blueprint, request, jsonify, current_app, send_file
+from flask import Blueprint, request, jsonify, current_app, send_file, Response, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from werkzeug.utils import secure_filename
 from models import db, Document, User
@@ -9,6 +10,117 @@ from services.document_service import analyze_document, allowed_file
 
 documents_bp = Blueprint('documents', __name__)
 
+# The jurisdiction hierarchy is constant; build the literal and encode
+# the full response body once at import instead of per request
+HIERARCHICAL_JURISDICTIONS = {
+    'us': {
+        'code': 'us',
+        'name': 'United States',
+        'description': 'US federal and state laws',
+        'subRegions': [
+            { 'code': 'federal', 'name': 'Federal (All States)', 'description': 'Federal regulations only' },
+            { 'code': 'ca', 'name': 'California', 'description': 'Including CCPA, CPRA' },
+            { 'code': 'ny', 'name': 'New York', 'description': 'Including SHIELD Act, NYDFS' },
+            { 'code': 'tx', 'name': 'Texas', 'description': 'Including TDPSA, Texas Privacy Act' },
+            { 'code': 'va', 'name': 'Virginia', 'description': 'Including VCDPA' },
+            { 'code': 'co', 'name': 'Colorado', 'description': 'Including CPA' },
+            { 'code': 'il', 'name': 'Illinois', 'description': 'Including BIPA' },
+            { 'code': 'fl', 'name': 'Florida', 'description': 'Including FIPA' },
+            { 'code': 'other', 'name': 'Other States', 'description': 'General compliance for other states' }
+        ]
+    },
+    'eu': {
+        'code': 'eu',
+        'name': 'European Union',
+        'description': 'EU and member state regulations',
+        'subRegions': [
+            { 'code': 'general', 'name': 'EU General', 'description': 'Pan-EU regulations including GDPR, ePrivacy' },
+            { 'code': 'de', 'name': 'Germany', 'description': 'Including BDSG, Telemediengesetz' },
+            { 'code': 'fr', 'name': 'France', 'description': 'Including CNIL regulations, French Data Protection Act' },
+            { 'code': 'it', 'name': 'Italy', 'description': 'Including Italian Privacy Code' },
+            { 'code': 'es', 'name': 'Spain', 'description': 'Including LOPDGDD' },
+            { 'code': 'nl', 'name': 'Netherlands', 'description': 'Including Dutch Telecommunications Act' },
+            { 'code': 'se', 'name': 'Sweden', 'description': 'Including Swedish Data Protection Act' },
+            { 'code': 'other', 'name': 'Other EU Countries', 'description': 'General compliance for other EU states' }
+        ]
+    },
+    'uk': {
+        'code': 'uk',
+        'name': 'United Kingdom',
+        'description': 'UK laws and regulations',
+        'subRegions': [
+            { 'code': 'general', 'name': 'UK General', 'description': 'Including UK GDPR, Data Protection Act, PECR' },
+            { 'code': 'england', 'name': 'England', 'description': 'England-specific regulations' },
+            { 'code': 'scotland', 'name': 'Scotland', 'description': 'Scotland-specific regulations' },
+            { 'code': 'wales', 'name': 'Wales', 'description': 'Wales-specific regulations' },
+            { 'code': 'ni', 'name': 'Northern Ireland', 'description': 'Northern Ireland-specific regulations' }
+        ]
+    },
+    'ca': {
+        'code': 'ca',
+        'name': 'Canada',
+        'description': 'Canadian regulations',
+        'subRegions': [
+            { 'code': 'federal', 'name': 'Federal', 'description': 'Including PIPEDA, CASL' },
+            { 'code': 'qc', 'name': 'Quebec', 'description': 'Including Quebec Privacy Law (Law 25)' },
+            { 'code': 'bc', 'name': 'British Columbia', 'description': 'Including PIPA BC' },
+            { 'code': 'ab', 'name': 'Alberta', 'description': 'Including PIPA Alberta' },
+            { 'code': 'on', 'name': 'Ontario', 'description': 'Including Ontario privacy regulations' },
+            { 'code': 'other', 'name': 'Other Provinces', 'description': 'General compliance for other provinces' }
+        ]
+    },
+    'au': {
+        'code': 'au',
+        'name': 'Australia',
+        'description': 'Australian laws',
+        'subRegions': [
+            { 'code': 'federal', 'name': 'Federal', 'description': 'Including Privacy Act, Consumer Law' },
+            { 'code': 'nsw', 'name': 'New South Wales', 'description': 'NSW-specific regulations' },
+            { 'code': 'vic', 'name': 'Victoria', 'description': 'Victoria-specific regulations' },
+            { 'code': 'qld', 'name': 'Queensland', 'description': 'Queensland-specific regulations' },
+            { 'code': 'other', 'name': 'Other States/Territories', 'description': 'General compliance for other areas' }
+        ]
+    },
+    'br': {
+        'code': 'br',
+        'name': 'Brazil',
+        'description': 'Brazilian laws',
+        'subRegions': [
+            { 'code': 'general', 'name': 'Federal', 'description': 'Including LGPD and federal regulations' }
+        ]
+    },
+    'jp': {
+        'code': 'jp',
+        'name': 'Japan',
+        'description': 'Japanese laws',
+        'subRegions': [
+            { 'code': 'general', 'name': 'National', 'description': 'Including APPI and national regulations' }
+        ]
+    },
+    'sg': {
+        'code': 'sg',
+        'name': 'Singapore',
+        'description': 'Singapore laws',
+        'subRegions': [
+            { 'code': 'general', 'name': 'National', 'description': 'Including PDPA and national regulations' }
+        ]
+    },
+    'global': {
+        'code': 'global',
+        'name': 'Global',
+        'description': 'Global compliance standards',
+        'subRegions': [
+            { 'code': 'general', 'name': 'International', 'description': 'General international compliance standards' }
+        ]
+    }
+}
+
+_HIER_JURISDICTIONS_BODY = json.dumps({
+    "success": True,
+    "message": "Jurisdictions retrieved successfully",
+    "jurisdictions": list(HIERARCHICAL_JURISDICTIONS.values())
+}).encode('utf-8')
+
 @documents_bp.route('/documents/upload', methods=['POST'])
 @jwt_required()
 def upload_document():
@@ -141,20 +253,33 @@ def upload_document():
             "error": str(e)
         }), 500
 
+# Above this many documents, stream the listing row by row instead of
+# buffering one large JSON string before the first byte goes out
+STREAM_THRESHOLD = 500
+
 @documents_bp.route('/documents', methods=['GET'])
 @jwt_required()
 def get_documents():
     """Get all documents for the current user."""
     user_id = int(get_jwt_identity())
-    
+
     # Get all documents for the user
     user_documents = Document.query.filter_by(user_id=user_id).all()
-    documents_data = [doc.to_dict() for doc in user_documents]
-    
+
+    if len(user_documents) > STREAM_THRESHOLD:
+        # Serialize incrementally: first-byte latency and peak memory stay
+        # independent of how many documents the user has accumulated
+        def generate():
+            yield '{"success": true, "message": "Documents retrieved successfully", "documents": ['
+            for i, doc in enumerate(user_documents):
+                yield (',' if i else '') + current_app.json.dumps(doc.to_dict())
+            yield ']}'
+        return Response(stream_with_context(generate()), mimetype='application/json')
+
     return jsonify({
         "success": True,
         "message": "Documents retrieved successfully",
-        "documents": documents_data
+        "documents": [doc.to_dict() for doc in user_documents]
     }), 200
 
 @documents_bp.route('/document/<int:document_id>/compliance', methods=['GET'])
@@ -269,114 +394,7 @@ def reanalyze_document(document_id):
 @jwt_required()
 def get_jurisdictions():
     """Get list of available jurisdictions for compliance analysis."""
-    hierarchical_jurisdictions = {
-        'us': {
-            'code': 'us',
-            'name': 'United States',
-            'description': 'US federal and state laws',
-            'subRegions': [
-                { 'code': 'federal', 'name': 'Federal (All States)', 'description': 'Federal regulations only' },
-                { 'code': 'ca', 'name': 'California', 'description': 'Including CCPA, CPRA' },
-                { 'code': 'ny', 'name': 'New York', 'description': 'Including SHIELD Act, NYDFS' },
-                { 'code': 'tx', 'name': 'Texas', 'description': 'Including TDPSA, Texas Privacy Act' },
-                { 'code': 'va', 'name': 'Virginia', 'description': 'Including VCDPA' },
-                { 'code': 'co', 'name': 'Colorado', 'description': 'Including CPA' },
-                { 'code': 'il', 'name': 'Illinois', 'description': 'Including BIPA' },
-                { 'code': 'fl', 'name': 'Florida', 'description': 'Including FIPA' },
-                { 'code': 'other', 'name': 'Other States', 'description': 'General compliance for other states' }
-            ]
-        },
-        'eu': {
-            'code': 'eu',
-            'name': 'European Union',
-            'description': 'EU and member state regulations',
-            'subRegions': [
-                { 'code': 'general', 'name': 'EU General', 'description': 'Pan-EU regulations including GDPR, ePrivacy' },
-                { 'code': 'de', 'name': 'Germany', 'description': 'Including BDSG, Telemediengesetz' },
-                { 'code': 'fr', 'name': 'France', 'description': 'Including CNIL regulations, French Data Protection Act' },
-                { 'code': 'it', 'name': 'Italy', 'description': 'Including Italian Privacy Code' },
-                { 'code': 'es', 'name': 'Spain', 'description': 'Including LOPDGDD' },
-                { 'code': 'nl', 'name': 'Netherlands', 'description': 'Including Dutch Telecommunications Act' },
-                { 'code': 'se', 'name': 'Sweden', 'description': 'Including Swedish Data Protection Act' },
-                { 'code': 'other', 'name': 'Other EU Countries', 'description': 'General compliance for other EU states' }
-            ]
-        },
-        'uk': {
-            'code': 'uk',
-            'name': 'United Kingdom',
-            'description': 'UK laws and regulations',
-            'subRegions': [
-                { 'code': 'general', 'name': 'UK General', 'description': 'Including UK GDPR, Data Protection Act, PECR' },
-                { 'code': 'england', 'name': 'England', 'description': 'England-specific regulations' },
-                { 'code': 'scotland', 'name': 'Scotland', 'description': 'Scotland-specific regulations' },
-                { 'code': 'wales', 'name': 'Wales', 'description': 'Wales-specific regulations' },
-                { 'code': 'ni', 'name': 'Northern Ireland', 'description': 'Northern Ireland-specific regulations' }
-            ]
-        },
-        'ca': {
-            'code': 'ca',
-            'name': 'Canada',
-            'description': 'Canadian regulations',
-            'subRegions': [
-                { 'code': 'federal', 'name': 'Federal', 'description': 'Including PIPEDA, CASL' },
-                { 'code': 'qc', 'name': 'Quebec', 'description': 'Including Quebec Privacy Law (Law 25)' },
-                { 'code': 'bc', 'name': 'British Columbia', 'description': 'Including PIPA BC' },
-                { 'code': 'ab', 'name': 'Alberta', 'description': 'Including PIPA Alberta' },
-                { 'code': 'on', 'name': 'Ontario', 'description': 'Including Ontario privacy regulations' },
-                { 'code': 'other', 'name': 'Other Provinces', 'description': 'General compliance for other provinces' }
-            ]
-        },
-        'au': {
-            'code': 'au',
-            'name': 'Australia',
-            'description': 'Australian laws',
-            'subRegions': [
-                { 'code': 'federal', 'name': 'Federal', 'description': 'Including Privacy Act, Consumer Law' },
-                { 'code': 'nsw', 'name': 'New South Wales', 'description': 'NSW-specific regulations' },
-                { 'code': 'vic', 'name': 'Victoria', 'description': 'Victoria-specific regulations' },
-                { 'code': 'qld', 'name': 'Queensland', 'description': 'Queensland-specific regulations' },
-                { 'code': 'other', 'name': 'Other States/Territories', 'description': 'General compliance for other areas' }
-            ]
-        },
-        'br': {
-            'code': 'br',
-            'name': 'Brazil',
-            'description': 'Brazilian laws',
-            'subRegions': [
-                { 'code': 'general', 'name': 'Federal', 'description': 'Including LGPD and federal regulations' }
-            ]
-        },
-        'jp': {
-            'code': 'jp',
-            'name': 'Japan',
-            'description': 'Japanese laws',
-            'subRegions': [
-                { 'code': 'general', 'name': 'National', 'description': 'Including APPI and national regulations' }
-            ]
-        },
-        'sg': {
-            'code': 'sg',
-            'name': 'Singapore',
-            'description': 'Singapore laws',
-            'subRegions': [
-                { 'code': 'general', 'name': 'National', 'description': 'Including PDPA and national regulations' }
-            ]
-        },
-        'global': {
-            'code': 'global',
-            'name': 'Global',
-            'description': 'Global compliance standards',
-            'subRegions': [
-                { 'code': 'general', 'name': 'International', 'description': 'General international compliance standards' }
-            ]
-        }
-    }
-    
-    return jsonify({
-        "success": True,
-        "message": "Jurisdictions retrieved successfully",
-        "jurisdictions": list(hierarchical_jurisdictions.values())
-    }), 200
+    return Response(_HIER_JURISDICTIONS_BODY, mimetype='application/json')
 
 # New endpoint to update user's preferred jurisdiction
 @documents_bp.route('/user/jurisdiction', methods=['PUT'])
@@ -1,9 +1,30 @@
-from flask import Blueprint, jsonify, request
+import json
+
+from flask import Blueprint, Response, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models import User, db
 
 users_bp = Blueprint('users', __name__)
 
+# The jurisdiction catalogue is constant, so build and serialize the
+# response once at import instead of per request
+AVAILABLE_JURISDICTIONS = [
+    { "code": "us", "name": "United States", "description": "US federal and state laws including CCPA, HIPAA, ADA, etc." },
+    { "code": "eu", "name": "European Union", "description": "EU regulations including GDPR, ePrivacy, Digital Services Act, etc." },
+    { "code": "uk", "name": "United Kingdom", "description": "UK laws including UK GDPR, Data Protection Act, PECR, etc." },
+    { "code": "ca", "name": "Canada", "description": "Canadian regulations including PIPEDA, CASL, etc." },
+    { "code": "au", "name": "Australia", "description": "Australian laws including Privacy Act, Consumer Law, etc." },
+    { "code": "it", "name": "Italy", "description": "Italian regulations including Privacy Code, Consumer Code, etc." },
+    { "code": "de", "name": "Germany", "description": "German regulations including BDSG, Telemedia Act, etc." },
+    { "code": "fr", "name": "France", "description": "French regulations including Data Protection Act, Consumer Code, etc." }
+]
+
+_JURISDICTIONS_BODY = json.dumps({
+    "success": True,
+    "message": "Jurisdictions retrieved successfully",
+    "jurisdictions": AVAILABLE_JURISDICTIONS
+}).encode('utf-8')
+
 @users_bp.route('/users', methods=['GET'])
 @jwt_required()
 def get_users():
@@ -109,19 +130,4 @@ def update_user_legal_sources():
 def get_available_jurisdictions():
     """Get a list of available jurisdictions for the system."""
     # In a production system, this would likely come from a database
-    jurisdictions = [
-        { "code": "us", "name": "United States", "description": "US federal and state laws including CCPA, HIPAA, ADA, etc." },
-        { "code": "eu", "name": "European Union", "description": "EU regulations including GDPR, ePrivacy, Digital Services Act, etc." },
-        { "code": "uk", "name": "United Kingdom", "description": "UK laws including UK GDPR, Data Protection Act, PECR, etc." },
-        { "code": "ca", "name": "Canada", "description": "Canadian regulations including PIPEDA, CASL, etc." },
-        { "code": "au", "name": "Australia", "description": "Australian laws including Privacy Act, Consumer Law, etc." },
-        { "code": "it", "name": "Italy", "description": "Italian regulations including Privacy Code, Consumer Code, etc." },
-        { "code": "de", "name": "Germany", "description": "German regulations including BDSG, Telemedia Act, etc." },
-        { "code": "fr", "name": "France", "description": "French regulations including Data Protection Act, Consumer Code, etc." }
-    ]
-    
-    return jsonify({
-        "success": True,
-        "message": "Jurisdictions retrieved successfully",
-        "jurisdictions": jurisdictions
-    }), 200
+    return Response(_JURISDICTIONS_BODY, mimetype='application/json')
@@ -1,23 +1,47 @@
 import functools
+import time
+
 from flask import jsonify
 from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 from models.user import User
 
+# Admin routes looked the user up on every request just to read the role.
+# Cache id -> role briefly so bursts of admin traffic hit the DB once per
+# user per TTL; a revoked admin keeps access for at most _ROLE_TTL seconds.
+_ROLE_CACHE = {}
+_ROLE_TTL = 60
+_ROLE_CACHE_MAX = 5000
+
+def _user_role(user_id):
+    """Return the user's role, served from a short-lived in-process cache."""
+    now = time.monotonic()
+    entry = _ROLE_CACHE.get(user_id)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    user = User.query.filter_by(id=user_id).first()
+    role = user.role if user else None
+
+    if len(_ROLE_CACHE) >= _ROLE_CACHE_MAX:
+        _ROLE_CACHE.clear()
+    _ROLE_CACHE[user_id] = (now + _ROLE_TTL, role)
+    return role
+
 def admin_required():
     """
     Decorator to protect routes that require admin privileges.
-    Must be applied after jwt_required() decorator.
+    Verifies the JWT itself, so stacking jwt_required() on top would
+    only decode and check the token a second time.
     """
     def wrapper(fn):
         @functools.wraps(fn)
         def decorator(*args, **kwargs):
             verify_jwt_in_request()
             user_id = int(get_jwt_identity())
-            user = User.query.filter_by(id=user_id).first()
-            
-            if not user or user.role != 'admin':
+
+            if _user_role(user_id) != 'admin':
                 return jsonify({"success": False, "message": "Admin privileges required"}), 403
-            
+
             return fn(*args, **kwargs)
         return decorator
     return wrapper
@@ -1,11 +1,24 @@
 """
 WSGI entry point for the Norma AI backend application.
 Used by Gunicorn in production environments.
+
+Run with gevent workers so concurrent I/O-bound requests (DB queries,
+JSON responses) don't serialize on a single thread:
+
+    gunicorn -c gunicorn_config.py wsgi:app
+
+or explicitly:
+
+    gunicorn --worker-class gevent --workers $((2*$(nproc)+1)) \
+        --worker-connections 1000 --keep-alive 5 wsgi:app
 """
 from app import create_app
 
 # Create the Flask application
 app = create_app()
 
+# Some WSGI servers look for the conventional `application` name
+application = app
+
 if __name__ == "__main__":
     app.run()
@@ -3,287 +3,269 @@
 Simple API server for Norma AI authentication testing
 """
 
+import atexit
 import os
 import logging
+import logging.handlers
+import threading
+import time
 from datetime import datetime
-from flask import Flask, jsonify, request, make_response
-from flask_cors import CORS
+import json
+from flask import Flask, Response, request, make_response
+from werkzeug.exceptions import HTTPException
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json still works
+    orjson = None
 
 # Configuration constants
 API_CONFIG = {
     'PORT': int(os.environ.get('PORT', 3002)),
     'HOST': '0.0.0.0',  # Bind to all interfaces
-    'DEBUG': True,
+    'DEBUG': os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true'),
     'CORS_ORIGINS': '*',  # For testing; restrict in production
     'API_PREFIX': '/api'
 }
 
-# Set up logging
+# Set up logging. Records are buffered in memory and flushed to stderr in
+# batches, so a burst of requests costs one write() syscall instead of one
+# per log line; ERROR and above flush immediately.
 logging.basicConfig(level=logging.INFO)
+_root_logger = logging.getLogger()
+_buffer_handler = logging.handlers.MemoryHandler(
+    capacity=int(os.environ.get('LOG_BUFFER', '1000')),
+    flushLevel=logging.ERROR,
+    target=_root_logger.handlers[0],
+    flushOnClose=True,
+)
+_root_logger.handlers[:] = [_buffer_handler]
+atexit.register(_buffer_handler.flush)
+
+def _flush_log_buffer():
+    # Bound how long a buffered record can sit unseen during quiet periods
+    while True:
+        time.sleep(0.1)
+        _buffer_handler.flush()
+
+threading.Thread(target=_flush_log_buffer, daemon=True).start()
+
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
-CORS(app, resources={f"{API_CONFIG['API_PREFIX']}/*": {"origins": API_CONFIG['CORS_ORIGINS']}})
+
+# The CORS headers never vary except for the origin echo, so build the
+# constant part once instead of five headers.add() calls per response
+_CORS_STATIC = (
+    ('Access-Control-Allow-Headers',
+     'Content-Type, Authorization, X-Requested-With, X-Debug-Client'),
+    ('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS'),
+    ('Access-Control-Allow-Credentials', 'true'),
+    ('Access-Control-Max-Age', '86400'),  # 24 hours
+)
 
 # Helper function to add CORS headers to all responses
 @app.after_request
 def add_cors_headers(response):
-    origin = request.headers.get('Origin', '*')
-    response.headers.add('Access-Control-Allow-Origin', origin)
-    response.headers.add('Access-Control-Allow-Headers', 
-                        'Content-Type, Authorization, X-Requested-With, X-Debug-Client')
-    response.headers.add('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-    response.headers.add('Access-Control-Allow-Credentials', 'true')
-    response.headers.add('Access-Control-Max-Age', '86400')  # 24 hours
-    logger.info(f"Response: {response.status_code} - Headers: {dict(response.headers)}")
+    response.headers['Access-Control-Allow-Origin'] = request.headers.get('Origin', '*')
+    response.headers.extend(_CORS_STATIC)
+    # Header dumps are DEBUG-only; the Headers object formats itself
+    # lazily, so no copy is made unless the record is actually emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response: %s - Headers: %s", response.status_code, response.headers)
     return response
 
-# Log all requests
+# Answer CORS preflights before routing, logging or view dispatch; the
+# add_cors_headers hook still decorates the response on the way out
+@app.before_request
+def handle_preflight():
+    if request.method == 'OPTIONS':
+        return make_response('', 200)
+
+# Log all requests (DEBUG only; gunicorn's access log covers production)
 @app.before_request
 def log_request():
-    logger.info(f"Request: {request.method} {request.path} - Headers: {dict(request.headers)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Request: %s %s - Headers: %s", request.method, request.path, request.headers)
+
+def fastjson(obj, status=200):
+    """Serialize a response with orjson's C encoder when it's installed."""
+    if orjson is not None:
+        return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+    return Response(json.dumps(obj).encode(), status=status, mimetype='application/json')
+
+# One catch-all replaces the per-view try/except scaffolding; it also
+# stops leaking exception text to clients
+@app.errorhandler(Exception)
+def handle_unexpected_error(e):
+    if isinstance(e, HTTPException):
+        return e
+    logger.exception("Unhandled error")
+    return fastjson({'success': False, 'message': 'Server error'}, status=500)
+
+# The mock payloads below are fully static, so serialize them once at
+# import instead of rebuilding the dicts and re-encoding per request
+_PROFILE_JSON = json.dumps({
+    'success': True,
+    'profile': {
+        'id': 1,
+        'email': 'user@example.com',
+        'firstName': 'Test',
+        'lastName': 'User',
+        'role': 'admin',
+        'createdAt': '2025-01-01T00:00:00Z',
+        'lastLogin': '2025-03-13T09:00:00Z',
+        'settings': {
+            'notifications': True,
+            'theme': 'light'
+        },
+        'preferences': {
+            'jurisdictions': ['US', 'EU', 'UK'],
+            'updateFrequency': 'daily',
+            'categories': ['tax', 'corporate', 'employment']
+        }
+    }
+}).encode()
+
+_UPDATES_JSON = json.dumps({
+    'success': True,
+    'updates': [
+        {
+            'id': 1,
+            'title': 'New Tax Regulations 2025',
+            'summary': 'Summary of the new tax regulations for 2025',
+            'content': 'Detailed content about the new tax regulations...',
+            'publishDate': '2025-03-10T14:30:00Z',
+            'category': 'tax',
+            'jurisdiction': 'US',
+            'importance': 'high'
+        },
+        {
+            'id': 2,
+            'title': 'EU Corporate Governance Update',
+            'summary': 'New corporate governance guidelines in EU',
+            'content': 'Detailed content about corporate governance...',
+            'publishDate': '2025-03-08T10:15:00Z',
+            'category': 'corporate',
+            'jurisdiction': 'EU',
+            'importance': 'medium'
+        },
+        {
+            'id': 3,
+            'title': 'UK Employment Law Changes',
+            'summary': 'Recent updates to UK employment laws',
+            'content': 'Detailed content about employment law changes...',
+            'publishDate': '2025-03-05T08:45:00Z',
+            'category': 'employment',
+            'jurisdiction': 'UK',
+            'importance': 'high'
+        }
+    ]
+}).encode()
+
+_INVALID_TOKEN_JSON = json.dumps({
+    'success': False,
+    'message': 'Invalid token'
+}).encode()
+
+def _check_token():
+    """Return the bearer token when the Authorization header carries a valid
+    test token, else None. One slice instead of split() - no list allocation."""
+    auth_header = request.headers.get('Authorization')
+    if not auth_header or not auth_header.startswith('Bearer '):
+        return None
+    token = auth_header[7:]
+    if token == 'test-token-12345' or token.startswith('test-'):
+        return token
+    return None
+
+# Timestamps only carry second precision for clients, so format at most
+# once per wall-clock second and serve the cached string in between
+_ts_cache = [0, '']
+
+def _iso_now():
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[0] = t
+        _ts_cache[1] = datetime.fromtimestamp(t).isoformat()
+    return _ts_cache[1]
 
 # Test connection endpoint
-@app.route(f"{API_CONFIG['API_PREFIX']}/test-connection", methods=['GET', 'OPTIONS'])
+@app.route(f"{API_CONFIG['API_PREFIX']}/test-connection", methods=['GET'])
 def test_connection():
     """Test connection to the API server"""
-    if request.method == 'OPTIONS':
-        return '', 200
-        
-    return jsonify({
+    return fastjson({
         'success': True,
         'message': 'API server is reachable',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _iso_now(),
         'version': '1.0.0'
     })
 
 # Basic login endpoint
-@app.route(f"{API_CONFIG['API_PREFIX']}/basic-login", methods=['POST', 'OPTIONS'])
+@app.route(f"{API_CONFIG['API_PREFIX']}/basic-login", methods=['POST'])
 def basic_login():
     """Simple login endpoint for testing"""
-    if request.method == 'OPTIONS':
-        return '', 200
-        
-    try:
-        data = request.get_json()
-        logger.info(f"Login request data: {data}")
-        
-        # For test purposes, any credentials are accepted
-        return jsonify({
-            "success": True,
-            "message": "Login successful",
-            "token": "test-token-12345",
-            "access_token": "test-token-12345", 
-            "user": {
-                "id": 1,
-                "email": data.get('email', 'user@example.com'),
-                "firstName": "Test",
-                "lastName": "User"
-            }
-        })
-    except Exception as e:
-        logger.error(f"Error in basic_login: {str(e)}", exc_info=True)
-        return jsonify({
-            "success": False,
-            "message": f"Error: {str(e)}"
-        }), 500
+    # silent=True returns None instead of raising on malformed JSON, and
+    # the parse result is cached on the request for any later reader
+    data = request.get_json(silent=True, cache=True) or {}
+
+    # For test purposes, any credentials are accepted
+    return fastjson({
+        "success": True,
+        "message": "Login successful",
+        "token": "test-token-12345",
+        "access_token": "test-token-12345",
+        "user": {
+            "id": 1,
+            "email": data.get('email', 'user@example.com'),
+            "firstName": "Test",
+            "lastName": "User"
+        }
+    })
 
 # Standard login endpoint that the frontend expects
-@app.route(f"{API_CONFIG['API_PREFIX']}/login", methods=['POST', 'OPTIONS'])
+@app.route(f"{API_CONFIG['API_PREFIX']}/login", methods=['POST'])
 def login():
     """Standard login endpoint that matches frontend expectations"""
-    if request.method == 'OPTIONS':
-        return '', 200
-        
-    try:
-        data = request.get_json()
-        logger.info(f"Login request data: {data}")
-        
-        # For test purposes, any credentials are accepted
-        return jsonify({
-            "success": True,
-            "message": "Login successful",
-            "token": "test-token-12345",
-            "access_token": "test-token-12345", 
-            "user": {
-                "id": 1,
-                "email": data.get('email', 'user@example.com'),
-                "firstName": "Test",
-                "lastName": "User"
-            }
-        })
-    except Exception as e:
-        logger.error(f"Error in login: {str(e)}", exc_info=True)
-        return jsonify({
-            "success": False,
-            "message": f"Error: {str(e)}"
-        }), 500
+    # silent=True returns None instead of raising on malformed JSON, and
+    # the parse result is cached on the request for any later reader
+    data = request.get_json(silent=True, cache=True) or {}
+
+    # For test purposes, any credentials are accepted
+    return fastjson({
+        "success": True,
+        "message": "Login successful",
+        "token": "test-token-12345",
+        "access_token": "test-token-12345",
+        "user": {
+            "id": 1,
+            "email": data.get('email', 'user@example.com'),
+            "firstName": "Test",
+            "lastName": "User"
+        }
+    })
 
 # Profile endpoint
-@app.route(f"{API_CONFIG['API_PREFIX']}/profile", methods=['GET', 'OPTIONS'])
+@app.route(f"{API_CONFIG['API_PREFIX']}/profile", methods=['GET'])
 def get_profile():
     """Return mock profile data for testing"""
-    # Handle preflight request
-    if request.method == 'OPTIONS':
-        return '', 200
-        
-    try:
-        # Log request details for debugging
-        auth_header = request.headers.get('Authorization')
-        logger.info(f"Profile request received. Headers: {dict(request.headers)}")
-        
-        # Check for missing authorization header
-        if not auth_header:
-            logger.warning("Authorization header missing in profile request")
-            return jsonify({
-                'success': False,
-                'message': 'Authorization header required'
-            }), 401
-            
-        # Log the token format
-        logger.info(f"Auth header format: {auth_header}")
-        
-        # Validate Bearer token format
-        if not auth_header.startswith('Bearer '):
-            logger.warning(f"Invalid auth header format: {auth_header}")
-            return jsonify({
-                'success': False,
-                'message': 'Invalid authorization format. Expected: Bearer TOKEN'
-            }), 401
-        
-        # Extract and validate token
-        token = auth_header.split(' ')[1]
-        logger.info(f"Token extracted: {token}")
-        
-        # Accept either test-token-12345 or any token starting with 'test-'
-        if token == 'test-token-12345' or token.startswith('test-'):
-            logger.info(f"Valid test token: {token}")
-            # Mock profile data
-            return jsonify({
-                'success': True,
-                'profile': {
-                    'id': 1,
-                    'email': 'user@example.com',
-                    'firstName': 'Test',
-                    'lastName': 'User',
-                    'role': 'admin',
-                    'createdAt': '2025-01-01T00:00:00Z',
-                    'lastLogin': '2025-03-13T09:00:00Z',
-                    'settings': {
-                        'notifications': True,
-                        'theme': 'light'
-                    },
-                    'preferences': {
-                        'jurisdictions': ['US', 'EU', 'UK'],
-                        'updateFrequency': 'daily',
-                        'categories': ['tax', 'corporate', 'employment']
-                    }
-                }
-            })
-        else:
-            logger.warning(f"Invalid token: {token}")
-            return jsonify({
-                'success': False,
-                'message': 'Invalid token'
-            }), 401
-            
-    except Exception as e:
-        # Log the full exception
-        logger.error(f"Error in get_profile: {str(e)}", exc_info=True)
-        return jsonify({
-            'success': False,
-            'message': f'Server error: {str(e)}'
-        }), 500
+    if _check_token() is None:
+        logger.warning("Unauthorized profile request")
+        return Response(_INVALID_TOKEN_JSON, status=401, mimetype='application/json')
+    return Response(_PROFILE_JSON, mimetype='application/json')
 
 # Legal updates endpoint
-@app.route(f"{API_CONFIG['API_PREFIX']}/legal-updates", methods=['GET', 'OPTIONS'])
+@app.route(f"{API_CONFIG['API_PREFIX']}/legal-updates", methods=['GET'])
 def get_legal_updates():
     """Return mock legal updates data for testing"""
-    # Handle preflight request
-    if request.method == 'OPTIONS':
-        return '', 200
-        
-    try:
-        # Log request details for debugging
-        auth_header = request.headers.get('Authorization')
-        logger.info(f"Legal updates request received. Headers: {dict(request.headers)}")
-        
-        # Check for missing authorization header
-        if not auth_header:
-            logger.warning("Authorization header missing in legal updates request")
-            return jsonify({
-                'success': False,
-                'message': 'Authorization header required'
-            }), 401
-            
-        # Log the token format
-        logger.info(f"Auth header format: {auth_header}")
-        
-        # Validate Bearer token format
-        if not auth_header.startswith('Bearer '):
-            logger.warning(f"Invalid auth header format: {auth_header}")
-            return jsonify({
-                'success': False,
-                'message': 'Invalid authorization format. Expected: Bearer TOKEN'
-            }), 401
-        
-        # Extract and validate token
-        token = auth_header.split(' ')[1]
-        logger.info(f"Token extracted: {token}")
-        
-        # Accept either test-token-12345 or any token starting with 'test-'
-        if token == 'test-token-12345' or token.startswith('test-'):
-            logger.info(f"Valid test token: {token}")
-            # Mock legal updates data
-            return jsonify({
-                'success': True,
-                'updates': [
-                    {
-                        'id': 1,
-                        'title': 'New Tax Regulations 2025',
-                        'summary': 'Summary of the new tax regulations for 2025',
-                        'content': 'Detailed content about the new tax regulations...',
-                        'publishDate': '2025-03-10T14:30:00Z',
-                        'category': 'tax',
-                        'jurisdiction': 'US',
-                        'importance': 'high'
-                    },
-                    {
-                        'id': 2,
-                        'title': 'EU Corporate Governance Update',
-                        'summary': 'New corporate governance guidelines in EU',
-                        'content': 'Detailed content about corporate governance...',
-                        'publishDate': '2025-03-08T10:15:00Z',
-                        'category': 'corporate',
-                        'jurisdiction': 'EU',
-                        'importance': 'medium'
-                    },
-                    {
-                        'id': 3,
-                        'title': 'UK Employment Law Changes',
-                        'summary': 'Recent updates to UK employment laws',
-                        'content': 'Detailed content about employment law changes...',
-                        'publishDate': '2025-03-05T08:45:00Z',
-                        'category': 'employment',
-                        'jurisdiction': 'UK',
-                        'importance': 'high'
-                    }
-                ]
-            })
-        else:
-            logger.warning(f"Invalid token: {token}")
-            return jsonify({
-                'success': False,
-                'message': 'Invalid token'
-            }), 401
-            
-    except Exception as e:
-        # Log the full exception
-        logger.error(f"Error in get_legal_updates: {str(e)}", exc_info=True)
-        return jsonify({
-            'success': False,
-            'message': f'Server error: {str(e)}'
-        }), 500
+    if _check_token() is None:
+        logger.warning("Unauthorized legal updates request")
+        return Response(_INVALID_TOKEN_JSON, status=401, mimetype='application/json')
+    return Response(_UPDATES_JSON, mimetype='application/json')
 
 if __name__ == '__main__':
-    app.run(debug=API_CONFIG['DEBUG'], host=API_CONFIG['HOST'], port=API_CONFIG['PORT'])
+    # Convenience runner for local testing only. Werkzeug is single-threaded
+    # and debug mode roughly halves throughput; for any load testing run:
+    #   gunicorn -k gevent -w $(( 2 * $(nproc) + 1 )) -b 0.0.0.0:3002 simple_api:app
+    app.run(debug=API_CONFIG['DEBUG'], host=API_CONFIG['HOST'],
+            port=API_CONFIG['PORT'], threaded=True)
@@ -18,7 +18,7 @@ fi
 echo "📡 Starting backend server on port 3001..."
 cd "$(dirname "$0")/norma_ai_backend"
 source venv/bin/activate
-python3 app.py &
+PORT=3001 gunicorn -c gunicorn_config.py wsgi:app &
 BACKEND_PID=$!
 echo "   Backend server started with PID: $BACKEND_PID"
 